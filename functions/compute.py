@@ -2,9 +2,10 @@ from collections import OrderedDict
 from typing import List
 import numpy as np
 
-from functions.format import format_heading, hhmmsscc_to_milliseconds, pad_with_zeros
-from functions.maths import compute_heading
-from functions.physics import estimate_instant_fuel_consumption
+from functions.data import column_as_float, column_as_time_ms, row_count
+from functions.format import format_fixed2_batch, format_fixed4_batch, format_headings_batch, pad_with_zeros_batch
+from functions.maths import compute_heading_vec, moving_average
+from functions.physics import estimate_instant_fuel_consumption_vec
 
 def compute_oversteer(
     data: OrderedDict[str, List[str]],
@@ -24,16 +25,14 @@ def compute_oversteer(
     Returns:
         OrderedDict[str, List[str]]: Updated data with the new oversteer column.
     """
-    nval = len(next(iter(data.values()))) if data else 0
-    data[oversteer_column] = []
-    for i in range(nval):
-        if i == 0:
-            over_val = 0.0
-        else:
-            rot = float(data[rotation_speed_column][i])
-            gyro_z = float(data[gyro_z_column][i])
-            over_val = rot + gyro_z # gyro_z is typically negative for clockwise rotation
-        data[oversteer_column].append(format_heading(over_val))
+    if row_count(data) == 0:
+        data[oversteer_column] = []
+        return data
+    rot = column_as_float(data, rotation_speed_column)
+    gyro_z = column_as_float(data, gyro_z_column)
+    over = rot + gyro_z # gyro_z is typically negative for clockwise rotation
+    over[0] = 0.0
+    data[oversteer_column] = format_headings_batch(over)
     return data
 
 def compute_rotation_speed(
@@ -56,29 +55,22 @@ def compute_rotation_speed(
     Returns:
         OrderedDict[str, List[str]]: Updated data with the new rotation speed column.
     """
-    nval = len(next(iter(data.values()))) if data else 0
-    raw_rotation_speeds: List[float] = []
-    for i in range(nval):
-        if i == 0:
-            raw_rotation_speeds.append(0.0)
-        else:
-            prev_heading = float(data[heading_column][i - 1])
-            curr_heading = float(data[heading_column][i])
-            # shortest angle difference in degrees (-180, +180]
-            delta_heading = (curr_heading - prev_heading + 540.0) % 360.0 - 180.0
-            prev_time = hhmmsscc_to_milliseconds(data[time_column][i - 1]) / 1000.0
-            curr_time = hhmmsscc_to_milliseconds(data[time_column][i]) / 1000.0
-            dt = curr_time - prev_time if curr_time != prev_time else 1e-6
-            raw_rotation_speeds.append(delta_heading / dt)
+    if row_count(data) == 0:
+        data[rotation_speed_column] = []
+        return data
+    heading = column_as_float(data, heading_column)
+    time_ms = column_as_time_ms(data, time_column)
+    # shortest angle difference in degrees [-180, +180)
+    delta_heading = np.diff(heading)
+    delta_heading -= 360.0 * np.floor((delta_heading + 180.0) / 360.0)
+    # seconds first, then the difference, as the per-row version rounded it
+    dt = np.diff(time_ms / 1000.0)
+    dt[dt == 0] = 1e-6
+    raw_rotation_speeds = np.zeros(heading.size)
+    np.divide(delta_heading, dt, out=raw_rotation_speeds[1:])
     # smoothing (moving average)
     window = max(1, int(smoothing_window))
-    smoothed: List[str] = []
-    for i in range(nval):
-        start = max(0, i - window // 2)
-        end = min(nval, i + window // 2 + 1)
-        smoothed_val = sum(raw_rotation_speeds[start:end]) / (end - start)
-        smoothed.append(f"{smoothed_val:.2f}")
-    data[rotation_speed_column] = smoothed
+    data[rotation_speed_column] = format_fixed2_batch(moving_average(raw_rotation_speeds, window))
     return data
 
 def gps_heading_function(
@@ -101,34 +93,23 @@ def gps_heading_function(
     Returns:
         OrderedDict[str, List[str]]: Updated data with the new heading column.
     """
-    nval = len(next(iter(data.values()))) if data else 0
     if heading_column not in data:
-        raw_headings = []
-        for i in range(nval):
-            if i == 0:
-                heading = 0.0
-            else:
-                lat1 = float(data[lat_column][i - 1])
-                lon1 = float(data[long_column][i - 1])
-                lat2 = float(data[lat_column][i])
-                lon2 = float(data[long_column][i])
-                heading = compute_heading(lat1, lon1, lat2, lon2)
-            raw_headings.append(heading)
-
-        # Apply moving average smoothing
-        if len(raw_headings) == 0:
-            smoothed_headings = []
+        if row_count(data) == 0:
+            data[heading_column] = []
         else:
-            # convert degrees -> radians, build unit phasors
-            raw_rad = np.deg2rad(np.asarray(raw_headings, dtype=float))
-            phasors = np.exp(1j * raw_rad)
-            # uniform kernel and convolution (same length output)
-            kernel = np.ones(smoothing_window, dtype=float) / smoothing_window
-            smoothed_phasors = np.convolve(phasors, kernel, mode='same')
-            # extract angle, convert to degrees and normalize
-            smoothed_headings = ((np.degrees(np.angle(smoothed_phasors)) + 360.0) % 360.0).tolist()
+            lat = column_as_float(data, lat_column)
+            lon = column_as_float(data, long_column)
+            raw_headings = np.concatenate(([0.0], compute_heading_vec(lat[:-1], lon[:-1], lat[1:], lon[1:])))
 
-        data[heading_column] = [format_heading(h) for h in smoothed_headings]
+            # Apply moving average smoothing on the heading unit vectors (circular mean), over the window of
+            # np.convolve(mode='same'); averaging clipped edges over fewer samples does not change the angle
+            raw_rad = np.deg2rad(raw_headings)
+            smoothed_sin = moving_average(np.sin(raw_rad), smoothing_window, convolve_same=True)
+            smoothed_cos = moving_average(np.cos(raw_rad), smoothing_window, convolve_same=True)
+            # convert back to degrees and normalize
+            smoothed_headings = (np.degrees(np.arctan2(smoothed_sin, smoothed_cos)) + 360.0) % 360.0
+
+            data[heading_column] = format_headings_batch(smoothed_headings)
 
     return data
 
@@ -148,23 +129,56 @@ def add_avitime_column(
         OrderedDict[str, List[str]]: The updated data mapping including 'avitime'.
 
     Notes:
-        - Assumes time_column contains values in HHMMSS.CC format and uses hhmmsscc_to_milliseconds()
+        - Assumes time_column contains values in HHMMSS.CC format and uses column_as_time_ms()
             to obtain per-row timestamps in milliseconds.
         - Each avitime value is formatted as a zero-padded string of length 9.
     """
     if 'avitime' not in data:
-        data['avitime'] = []
-        nval = len(next(iter(data.values()))) if data else 0
-        for i in range(nval):
-            if i == 0:
-                avitime = start_sync_time
-            else:
-                prev_time_ms = hhmmsscc_to_milliseconds(data[time_column][i - 1])
-                curr_time_ms = hhmmsscc_to_milliseconds(data[time_column][i])
-                avitime += curr_time_ms - prev_time_ms
-            avitime_str = pad_with_zeros(avitime, 9)
-            data['avitime'].append(avitime_str)
-        return data
+        if row_count(data) == 0:
+            data['avitime'] = []
+        else:
+            time_ms = column_as_time_ms(data, time_column)
+            avitime = start_sync_time + (time_ms - time_ms[:1])
+            data['avitime'] = pad_with_zeros_batch(avitime, 9)
+    return data
+
+_DAY_MS = 86_400_000
+
+def _time_window_starts(time_ms: np.ndarray, time_window_sec: float) -> np.ndarray:
+    """
+    For each row i, index of the first row of the contiguous run j..i whose times are all
+    >= time[i] - time_window_sec (backward scan stopping at the first older row).
+
+    Parameters:
+        time_ms (np.ndarray): Row times in milliseconds (HHMMSS.CC, so they wrap at midnight).
+        time_window_sec (float): Window length in seconds.
+
+    Returns:
+        np.ndarray: int64 start index for every row.
+
+    Notes:
+        - Backward jumps of more than half a day are midnight wraps and are unwrapped first.
+        - Sorted times use a single searchsorted(); any remaining backward jump (GPS time glitch)
+          falls back to the row-by-row backward scan.
+    """
+    times = time_ms.astype(np.float64)
+    steps = np.diff(times)
+    if (steps < 0).any():
+        wraps = steps < -_DAY_MS / 2
+        if wraps.any():
+            times[1:] += _DAY_MS * np.cumsum(wraps)
+            steps = np.diff(times)
+    times /= 1000.0
+    if not (steps < 0).any():
+        return np.searchsorted(times, times - time_window_sec, side='left')
+
+    starts = np.empty(times.size, dtype=np.int64)
+    for i, window_start_time in enumerate((times - time_window_sec).tolist()):
+        j = i
+        while j > 0 and times[j - 1] >= window_start_time:
+            j -= 1
+        starts[i] = j
+    return starts
 
 def compute_fuel_consumption_avg(
     data: OrderedDict[str, List[str]],
@@ -196,39 +210,23 @@ def compute_fuel_consumption_avg(
     Returns:
         OrderedDict[str, List[str]]: Updated data with new fuel consumption columns.
     """
-    nval = len(next(iter(data.values()))) if data else 0
-    fuel_consumption_inst = []
-    data[fuel_consumption_column] = []
-    
-    for i in range(nval):
-        # Estimate instantaneous fuel consumption
-        rpm = float(data[rpm_column][i])
-        throttle = float(data[throttle_column][i])
-        intake_temp = float(data[intake_temp_column][i])
-        
-        inst_fuel_consumption = estimate_instant_fuel_consumption(
-            rpm, throttle, intake_temp, engine_displacement_cc, ve, lambda_value
-        )
-        fuel_consumption_inst.append(f"{inst_fuel_consumption:.4f}")
-        
-        # Compute average over time window
-        if i == 0:
-            avg_fuel_consumption = inst_fuel_consumption
-        else:
-            curr_time = hhmmsscc_to_milliseconds(data[time_column][i]) / 1000.0
-            window_start_time = curr_time - time_window_sec
-
-            # Collect instantaneous fuel consumption values within the time window
-            fuel_consumption_values = []
-            for j in range(i, -1, -1):
-                row_time = hhmmsscc_to_milliseconds(data[time_column][j]) / 1000.0
-                if row_time < window_start_time:
-                    break
-                fuel_consumption_values.append(float(fuel_consumption_inst[j]))
-
-            # Compute average
-            avg_fuel_consumption = sum(fuel_consumption_values) / len(fuel_consumption_values) if fuel_consumption_values else 0.0
-
-        data[fuel_consumption_column].append(f"{avg_fuel_consumption:.4f}")
-    
+    nval = row_count(data)
+    if nval == 0:
+        data[fuel_consumption_column] = []
+        return data
+    # Estimate instantaneous fuel consumption
+    inst_fuel_consumption = estimate_instant_fuel_consumption_vec(
+        column_as_float(data, rpm_column),
+        column_as_float(data, throttle_column),
+        column_as_float(data, intake_temp_column),
+        engine_displacement_cc, ve, lambda_value
+    )
+
+    # Compute average over time window: rows j <= i with time[j] >= time[i] - time_window_sec
+    window_start_idx = _time_window_starts(column_as_time_ms(data, time_column), time_window_sec)
+    window_end_idx = np.arange(1, nval + 1)
+    csum = np.concatenate(([0.0], np.cumsum(inst_fuel_consumption)))
+    avg_fuel_consumption = (csum[window_end_idx] - csum[window_start_idx]) / (window_end_idx - window_start_idx)
+
+    data[fuel_consumption_column] = format_fixed4_batch(avg_fuel_consumption)
     return data
\ No newline at end of file
@@ -0,0 +1,141 @@
+from collections import OrderedDict
+from typing import Any, Dict, List, Tuple
+import numpy as np
+
+from functions.format import hhmmsscc_batch_to_ms
+
+class VboData(OrderedDict):
+    """
+    Column store for the [data] section of a .vbo file.
+
+    Behaves exactly like the OrderedDict[str, List[str]] handed to compute functions (column name ->
+    list of textual values, as written to the file) and additionally keeps float64 copies of the
+    columns that have been read numerically and millisecond arrays of the time columns that have
+    been decoded, so compute functions sharing an input column parse its strings only once per file.
+
+    Notes:
+        - Each cached array is stored with a snapshot of the strings it was parsed from and is only
+          reused while the column still holds those strings, so cells edited in place are parsed again.
+          The check compares string references first and costs far less than parsing.
+        - Cached arrays are read-only and are dropped when their column is replaced or removed.
+        - Copies share the cache with the mapping they were made from.
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        self._numeric: Dict[str, Tuple[List[str], np.ndarray]] = {}
+        self._time_ms: Dict[str, Tuple[List[str], np.ndarray]] = {}
+        super().__init__(*args, **kwargs)
+
+    def __setitem__(self, column: str, values: List[str]) -> None:
+        self._invalidate(column)
+        super().__setitem__(column, values)
+
+    def __delitem__(self, column: str) -> None:
+        self._invalidate(column)
+        super().__delitem__(column)
+
+    def pop(self, column: str, *default: Any) -> Any:
+        self._invalidate(column)
+        return super().pop(column, *default)
+
+    def _invalidate(self, column: str) -> None:
+        self._numeric.pop(column, None)
+        self._time_ms.pop(column, None)
+
+    def copy(self) -> 'VboData':
+        """
+        Shallow copy sharing the column lists and the cache of parsed arrays.
+        """
+        data = VboData(self)
+        data._numeric = self._numeric
+        data._time_ms = self._time_ms
+        return data
+
+    @property
+    def n_rows(self) -> int:
+        """
+        Number of rows, taken from the first column.
+        """
+        return len(next(iter(self.values()))) if self else 0
+
+    def numeric(self, column: str) -> np.ndarray:
+        """
+        Return a column as a float64 array, parsing its strings unless they are unchanged since the last parse.
+
+        Parameters:
+            column (str): Data column name.
+
+        Returns:
+            np.ndarray: Read-only float64 array with one value per row.
+        """
+        strings = self[column]
+        cached = self._numeric.get(column)
+        if cached is not None and cached[0] == strings:
+            return cached[1]
+        values = np.asarray(strings, dtype=np.float64)
+        values.flags.writeable = False
+        self._numeric[column] = (list(strings), values)
+        return values
+
+    def time_ms(self, column: str) -> np.ndarray:
+        """
+        Return a HHMMSS.CC time column in milliseconds, decoding its strings unless they are unchanged since the last decode.
+
+        Parameters:
+            column (str): Data column name.
+
+        Returns:
+            np.ndarray: Read-only int64 array with one value per row.
+        """
+        strings = self[column]
+        cached = self._time_ms.get(column)
+        if cached is not None and cached[0] == strings:
+            return cached[1]
+        values = hhmmsscc_batch_to_ms(strings)
+        values.flags.writeable = False
+        self._time_ms[column] = (list(strings), values)
+        return values
+
+def row_count(data: OrderedDict[str, List[str]]) -> int:
+    """
+    Return the number of rows of a data mapping, using the VboData cache when available.
+
+    Parameters:
+        data (OrderedDict[str, List[str]]): Data mapping column->list-of-values.
+
+    Returns:
+        int: Length of the first column, 0 for an empty mapping.
+    """
+    if isinstance(data, VboData):
+        return data.n_rows
+    return len(next(iter(data.values()))) if data else 0
+
+def column_as_float(data: OrderedDict[str, List[str]], column: str) -> np.ndarray:
+    """
+    Return a data column as a float64 array, using the VboData cache when available.
+
+    Parameters:
+        data (OrderedDict[str, List[str]]): Data mapping column->list-of-values.
+        column (str): Data column name.
+
+    Returns:
+        np.ndarray: float64 array with one value per row. Must not be modified in place.
+    """
+    if isinstance(data, VboData):
+        return data.numeric(column)
+    return np.asarray(data[column], dtype=np.float64)
+
+def column_as_time_ms(data: OrderedDict[str, List[str]], column: str) -> np.ndarray:
+    """
+    Return a HHMMSS.CC time column in milliseconds, using the VboData cache when available.
+
+    Parameters:
+        data (OrderedDict[str, List[str]]): Data mapping column->list-of-values.
+        column (str): Time column name.
+
+    Returns:
+        np.ndarray: int64 array with one value per row. Must not be modified in place.
+    """
+    if isinstance(data, VboData):
+        return data.time_ms(column)
+    return hhmmsscc_batch_to_ms(data[column])
\ No newline at end of file
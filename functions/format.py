@@ -1,3 +1,10 @@
+from typing import List
+import numpy as np
+
+_HEADING_FMT = "{:05.2f}".format
+_FIXED2_FMT = "{:.2f}".format
+_FIXED4_FMT = "{:.4f}".format
+
 def pad_with_zeros(number: int, total_length: int) -> str:
     """
     Zero-pad an integer to a fixed width.
@@ -11,6 +18,19 @@ def pad_with_zeros(number: int, total_length: int) -> str:
     """
     return str(number).zfill(total_length)
 
+def pad_with_zeros_batch(numbers: np.ndarray, total_length: int) -> List[str]:
+    """
+    Zero-pad an array of integers to a fixed width, as pad_with_zeros() does for one value.
+
+    Parameters:
+        numbers (np.ndarray): Integers to format.
+        total_length (int): Total number of digits desired (leading zeros added as needed).
+
+    Returns:
+        List[str]: Zero-padded decimal strings.
+    """
+    return list(map(f"{{:0{total_length}d}}".format, numbers.tolist()))
+
 def format_heading(heading: float) -> str:
     """
     Format heading value for VBO output.
@@ -22,7 +42,43 @@ def format_heading(heading: float) -> str:
         str: Formatted heading string with 2 decimal places and at least 5 characters,
              zero-padded as needed (example '012.345').
     """
-    return f"{heading:05.2f}"
+    return _HEADING_FMT(heading)
+
+def format_headings_batch(headings: np.ndarray) -> List[str]:
+    """
+    Format an array of heading values for VBO output, as format_heading() does for one value.
+
+    Parameters:
+        headings (np.ndarray): Headings in degrees.
+
+    Returns:
+        List[str]: Formatted heading strings with 2 decimal places and at least 5 characters.
+    """
+    return list(map(_HEADING_FMT, headings.tolist()))
+
+def format_fixed2_batch(values: np.ndarray) -> List[str]:
+    """
+    Format an array of values with 2 decimal places and no padding.
+
+    Parameters:
+        values (np.ndarray): Values to format.
+
+    Returns:
+        List[str]: Formatted strings (example '-12.35').
+    """
+    return list(map(_FIXED2_FMT, values.tolist()))
+
+def format_fixed4_batch(values: np.ndarray) -> List[str]:
+    """
+    Format an array of values with 4 decimal places and no padding.
+
+    Parameters:
+        values (np.ndarray): Values to format.
+
+    Returns:
+        List[str]: Formatted strings (example '0.0196').
+    """
+    return list(map(_FIXED4_FMT, values.tolist()))
 
 def hhmmsscc_to_milliseconds(timestr: str) -> int:
     """
@@ -38,7 +94,16 @@ def hhmmsscc_to_milliseconds(timestr: str) -> int:
     Example:
         '094559.96' -> (9 hours, 45 minutes, 59.96 seconds) -> 34,199,960 ms
     """
-    # ...existing code...
+    # Fast path for the canonical fixed-width 'HHMMSS.CC' layout
+    b = timestr.encode()
+    if len(b) == 9 and b[6] == 46 and b[:6].isdigit() and b[7:].isdigit():
+        return (
+            ((b[0] - 48) * 10 + (b[1] - 48)) * 3600000 +
+            ((b[2] - 48) * 10 + (b[3] - 48)) * 60000 +
+            ((b[4] - 48) * 10 + (b[5] - 48)) * 1000 +
+            ((b[7] - 48) * 10 + (b[8] - 48)) * 10
+        )
+
     timestr = timestr.strip()
     if '.' in timestr:
         main, centis = timestr.split('.')
@@ -56,4 +121,31 @@ def hhmmsscc_to_milliseconds(timestr: str) -> int:
         seconds * 1000 +
         centiseconds * 10
     )
-    return total_ms
\ No newline at end of file
+    return total_ms
+
+def hhmmsscc_batch_to_ms(times: List[str]) -> np.ndarray:
+    """
+    Convert a list of time strings in HHMMSS.CC format to milliseconds in one pass.
+
+    Parameters:
+        times (List[str]): Time strings in the format 'HHMMSS.CC' (centiseconds).
+
+    Returns:
+        np.ndarray: int64 array of total milliseconds, one value per input string.
+
+    Notes:
+        - Canonical 9-character values are decoded with NumPy arithmetic on their code points.
+        - Any other layout (missing leading zeros, surrounding spaces, ...) falls back to
+          hhmmsscc_to_milliseconds() for every value.
+    """
+    arr = np.asarray(times, dtype=np.str_)
+    if arr.size and arr.dtype.itemsize == 9 * 4:
+        chars = arr.view(np.uint32).reshape(-1, 9).astype(np.int64)
+        digits = chars[:, [0, 1, 2, 3, 4, 5, 7, 8]] - ord('0')
+        if (chars[:, 6] == ord('.')).all() and ((digits >= 0) & (digits <= 9)).all():
+            hours = 10 * digits[:, 0] + digits[:, 1]
+            minutes = 10 * digits[:, 2] + digits[:, 3]
+            seconds = 10 * digits[:, 4] + digits[:, 5]
+            centiseconds = 10 * digits[:, 6] + digits[:, 7]
+            return ((hours * 3600 + minutes * 60 + seconds) * 1000 + centiseconds * 10).astype(np.int64)
+    return np.fromiter(map(hhmmsscc_to_milliseconds, times), dtype=np.int64, count=len(times))
\ No newline at end of file
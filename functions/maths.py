@@ -1,4 +1,5 @@
 import math
+import numpy as np
 
 def compute_heading(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
     """
@@ -26,4 +27,63 @@ def compute_heading(lat1: float, lon1: float, lat2: float, lon2: float) -> float
     # Convert from radians to degrees and normalize to [0,360)
     bearing = (math.degrees(initial_bearing) + 360.0) % 360.0
 
-    return bearing
\ No newline at end of file
+    return bearing
+
+def compute_heading_vec(lat1: np.ndarray, lon1: np.ndarray, lat2: np.ndarray, lon2: np.ndarray) -> np.ndarray:
+    """
+    Vectorized compute_heading() over arrays of point pairs.
+
+    Parameters:
+        lat1 (np.ndarray): Latitudes of the first points in degrees.
+        lon1 (np.ndarray): Longitudes of the first points in degrees.
+        lat2 (np.ndarray): Latitudes of the second points in degrees.
+        lon2 (np.ndarray): Longitudes of the second points in degrees.
+
+    Returns:
+        np.ndarray: Bearings (headings) in degrees clockwise from North in range [0, 360).
+    """
+    lat1_rad = np.deg2rad(lat1)
+    lat2_rad = np.deg2rad(lat2)
+    dlon_rad = np.deg2rad(lon2 - lon1)
+
+    x = np.sin(dlon_rad) * np.cos(lat2_rad)
+    y = np.cos(lat1_rad) * np.sin(lat2_rad) - \
+        np.sin(lat1_rad) * np.cos(lat2_rad) * np.cos(dlon_rad)
+
+    return (np.degrees(np.arctan2(x, y)) + 360.0) % 360.0
+
+def moving_average(values: np.ndarray, window: int, convolve_same: bool = False) -> np.ndarray:
+    """
+    Centered moving average, computed with np.convolve.
+
+    Parameters:
+        values (np.ndarray): 1-D array of values to smooth.
+        window (int): Window size (odd recommended). The window is clipped at both array edges,
+            so edge values are averaged over fewer samples.
+        convolve_same (bool): Use the window of np.convolve(values, kernel, mode='same'): exactly `window`
+            samples, with one more before the row than after it for an even window. By default the window
+            spans window // 2 samples on each side of the row.
+
+    Returns:
+        np.ndarray: Smoothed values, same length as the input.
+
+    Raises:
+        ValueError: If window is smaller than 1.
+
+    Notes:
+        - Each window is summed directly rather than as a difference of cumulative sums, so the result
+          does not drift along the array and a window of equal values averages to exactly that value.
+    """
+    if window < 1:
+        raise ValueError(f"Moving average window must be at least 1, got {window}.")
+    nval = values.shape[0]
+    if nval == 0:
+        return np.zeros(0)
+    half = window // 2
+    after = (window - 1) // 2 if convolve_same else half
+    # Window sums: the full convolution with a box kernel, shifted so each row sits at its window position
+    sums = np.convolve(values, np.ones(half + after + 1))[after:after + nval]
+    index = np.arange(nval)
+    counts = np.minimum(index + after + 1, nval) - np.maximum(index - half, 0)
+    sums /= counts
+    return sums
\ No newline at end of file
@@ -1,3 +1,13 @@
+import numpy as np
+
+# Constants shared by the scalar and vectorized fuel consumption estimates
+_STANDARD_AIR_DENSITY = 1.225  # kg/m³ at 15°C and sea level
+_KELVIN_CONVERSION = 273.15
+_REFERENCE_TEMP_CELSIUS = 15.0
+_RPM_TO_FIRINGS_FACTOR = 120.0  # 4-stroke engine: 2 revolutions per power stroke
+_GASOLINE_DENSITY = 745.0  # g/L
+_STOICHIOMETRIC_AFR = 14.7  # gasoline air-fuel ratio by mass
+
 def estimate_instant_fuel_consumption(
     rpm: float,
     throttle: float,
@@ -23,14 +33,8 @@ def estimate_instant_fuel_consumption(
     if rpm == 0:
         return 0.0
     
-    standard_air_density = 1.225  # kg/m³ at 15°C and sea level
-    kelvin_conversion = 273.15
-    reference_temp_celsius = 15.0
-    rpm_to_firings_factor = 120.0  # 4-stroke engine: 2 revolutions per power stroke
-    gasoline_density = 745.0  # g/L
-    
     # Air density correction for temperature (g/L) using Ideal Gas Law
-    air_density = standard_air_density * ((reference_temp_celsius + kelvin_conversion) / (kelvin_conversion + intake_temp))
+    air_density = _STANDARD_AIR_DENSITY * ((_REFERENCE_TEMP_CELSIUS + _KELVIN_CONVERSION) / (_KELVIN_CONVERSION + intake_temp))
 
     # Air mass entering cylinders per revolution (g)
     displacement_liters = engine_displacement_cc / 1000
@@ -43,9 +47,38 @@ def estimate_instant_fuel_consumption(
     air_mass_per_rev = total_intake_volume * air_density
     
     # Fuel mass entering cylinders per revolution (g)
-    fuel_mass_per_rev = air_mass_per_rev / (14.7 * lambda_value)
+    fuel_mass_per_rev = air_mass_per_rev / (_STOICHIOMETRIC_AFR * lambda_value)
     
     # Fuel consumption per second (g/s)
-    fuel_consumption_g_per_sec = fuel_mass_per_rev * (rpm / rpm_to_firings_factor)
+    fuel_consumption_g_per_sec = fuel_mass_per_rev * (rpm / _RPM_TO_FIRINGS_FACTOR)
+
+    return fuel_consumption_g_per_sec / _GASOLINE_DENSITY * 60  # Convert to liters per minute
+
+def estimate_instant_fuel_consumption_vec(
+    rpm: np.ndarray,
+    throttle: np.ndarray,
+    intake_temp: np.ndarray,
+    engine_displacement_cc: int,
+    ve: float,
+    lambda_value: float
+) -> np.ndarray:
+    """
+    Vectorized estimate_instant_fuel_consumption() over whole columns.
+
+    Parameters:
+        rpm (np.ndarray): Engine speed in revolutions per minute.
+        throttle (np.ndarray): Throttle position (0-100).
+        intake_temp (np.ndarray): Intake air temperature in Celsius.
+        engine_displacement_cc (int): Engine displacement in cubic centimeters.
+        ve (float): Volumetric efficiency (range 0.7-0.95).
+        lambda_value (float): Air-fuel ratio (1.0 for stoichiometric).
+
+    Returns:
+        np.ndarray: Instantaneous fuel consumption in liters per minute, 0.0 where rpm is 0.
+    """
+    air_density = _STANDARD_AIR_DENSITY * ((_REFERENCE_TEMP_CELSIUS + _KELVIN_CONVERSION) / (_KELVIN_CONVERSION + intake_temp))
+    total_intake_volume = ve * (engine_displacement_cc / 1000) * (throttle / 100)
+    fuel_mass_per_rev = total_intake_volume * air_density / (_STOICHIOMETRIC_AFR * lambda_value)
+    fuel_consumption_g_per_sec = fuel_mass_per_rev * (rpm / _RPM_TO_FIRINGS_FACTOR)
 
-    return fuel_consumption_g_per_sec / gasoline_density * 60  # Convert to liters per minute
\ No newline at end of file
+    return np.where(rpm == 0, 0.0, fuel_consumption_g_per_sec / _GASOLINE_DENSITY * 60)
\ No newline at end of file
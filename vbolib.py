@@ -1,23 +1,32 @@
 from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 import logging
-from typing import Callable, List, Optional, Any
+import os
+import sys
+from typing import Callable, Dict, Iterator, List, Optional, Any
 from functools import partial
 
+from functions.data import VboData
 from functions.format import pad_with_zeros
 from functions.compute import compute_oversteer, compute_rotation_speed, gps_heading_function, add_avitime_column, compute_fuel_consumption_avg
 
+# Number of leading values inspected to decide whether a [data] column is worth interning
+_INTERN_SAMPLE_SIZE = 256
+
 class VboFile:
     """
     Parser, editor, and writer for Racelogic/VBox .vbo files.
 
     Attributes:
         filepath (str): Path to the source .vbo file.
-        sections (OrderedDict[str, Any]): Parsed sections of the file. Section names are keys
+        sections (Dict[str, Any]): Parsed sections of the file. Section names are keys
             (including their surrounding brackets, e.g. '[data]') and values contain the raw
-            content for that section (lists of lines or OrderedDict for data).
+            content for that section (lists of lines, or a VboData column mapping for '[data]').
         nval (int): Number of data rows parsed from the [data] section.
     """
 
+    __slots__ = ('filepath', 'sections', 'nval')
+
     def __init__(self, filepath: str) -> None:
         """
         Initialize a VboFile by reading and parsing a .vbo file.
@@ -27,44 +36,147 @@ class VboFile:
 
         Raises:
             ValueError: If multiple [column names] lines are found.
+            ValueError: If a data line does not have one value per [column names] entry.
         """
 
         self.filepath: str = filepath
-        self.sections: OrderedDict[str, Any] = OrderedDict()
+        self.sections: Dict[str, Any] = {}
         self.nval: int = 0
         section: Optional[str] = None
+        columns: List[List[str]] = []
+        col_appends: List[Callable[[str], None]] = []
+        column_names: List[str] = []
+        ncols = 0
 
+        # Stream the file in text mode: universal newlines turn '\r\n' and '\r' into '\n' without splitting on
+        # form feeds or other separators, and no full copy of the file is held next to the parsed rows
         with open(filepath, 'r', encoding='utf-8') as f:
-            for line in f:
-                line = line.rstrip('\n')
-                line_stripped = line.strip()
+            lines = (raw_line.rstrip('\n') for raw_line in f)
+            line: Optional[str] = next(lines, None)
+            while line is not None:
+                # Only lines starting with '[' or whitespace can be section headers: skip strip() for the others
+                first = line[:1]
+                line_stripped = line.strip() if first == '[' or first.isspace() else line
                 if line_stripped.startswith('[') and line_stripped.endswith(']'):
                     section = line_stripped.lower()
                     if section != '[data]':
                         self.sections[section] = []
                     else:
-                        self.sections[section] = OrderedDict()
-                    continue
-                if line != '':
+                        self.sections[section] = VboData()
+                        if ncols:
+                            if not columns:
+                                columns = [[] for _ in range(ncols)]
+                                col_appends = [values.append for values in columns]
+                            nrows = len(columns[0])
+                            # Column names are known: tight loop over the rows, only leaving on the next section header
+                            line = None
+                            for row_line in lines:
+                                line_list = row_line.split()
+                                if not line_list:
+                                    continue
+                                if line_list[0][0] == '[' and line_list[-1][-1] == ']':
+                                    line = row_line
+                                    break
+                                nrows += 1
+                                if len(line_list) != ncols:
+                                    raise ValueError(f"Data line {nrows} has {len(line_list)} values, expected {ncols} from [column names].")
+                                # Append straight into the column lists: no row lists are kept around
+                                for append, value in zip(col_appends, line_list):
+                                    append(value)
+                            continue
+                elif line != '':
                     if section == '[column names]':
                         if '[column names]' in self.sections and not self.sections['[column names]']:
-                            self.sections['[column names]'] = line.split(' ')
+                            column_names = self.sections['[column names]'] = list(map(sys.intern, line.split()))
+                            ncols = len(column_names)
                         else:
                             raise ValueError("Multiple [column names] lines found.")
                     elif section == '[data]':
-                        if '[column names]' in self.sections and self.sections['[column names]']:
-                            self.nval += 1
-                            for i, col in enumerate(self.sections['[column names]']):
-                                line_list = line.split(' ')
-                                if col in self.sections[section]:
-                                    self.sections[section][col].append(line_list[i])
-                                else:
-                                    self.sections[section][col] = [line_list[i]]
+                        # Rows found before [column names] cannot be mapped to columns
+                        pass
                     elif section:
                         self.sections[section].append(line)
                     else:
                         # For lines before any section (file header)
                         self.sections.setdefault('file_header', []).append(line)
+                line = next(lines, None)
+
+        # Install one list per column
+        self.nval = len(columns[0]) if columns else 0
+        if self.nval:
+            data = self.sections['[data]']
+            for col, values in zip(column_names, columns):
+                sample = values[:_INTERN_SAMPLE_SIZE]
+                if len(set(sample)) * 4 <= len(sample):
+                    # Low-cardinality column (satellites, flags, ...): share one str object per distinct value
+                    pool: Dict[str, str] = {}
+                    values[:] = map(pool.setdefault, values, values)
+                data[col] = values
+
+    @staticmethod
+    def iter_rows(filepath: str) -> Iterator[Dict[str, str]]:
+        """
+        Stream the [data] rows of a .vbo file one at a time, without loading the whole file.
+
+        Parameters:
+            filepath (str): Path to the .vbo file to read.
+
+        Returns:
+            Iterator[Dict[str, str]]: One mapping column name -> textual value per data row, in file order.
+
+        Raises:
+            ValueError: If multiple [column names] lines are found.
+            ValueError: If a data line does not have one value per [column names] entry.
+
+        Notes:
+            - Only the current line is held in memory, so this suits multi-hour logs that only need to be scanned.
+            - Use VboFile(filepath) to edit or write the file.
+        """
+        section: Optional[str] = None
+        column_names: List[str] = []
+        nrows = 0
+        with open(filepath, 'r', encoding='utf-8') as f:
+            for line in f:
+                first = line[:1]
+                line_stripped = line.strip() if first == '[' or first.isspace() else line
+                if line_stripped.startswith('[') and line_stripped.endswith(']'):
+                    section = line_stripped.lower()
+                elif not line_stripped:
+                    continue
+                elif section == '[column names]':
+                    if column_names:
+                        raise ValueError("Multiple [column names] lines found.")
+                    column_names = line.split()
+                elif section == '[data]' and column_names:
+                    values = line.split()
+                    nrows += 1
+                    if len(values) != len(column_names):
+                        raise ValueError(f"Data line {nrows} has {len(values)} values, expected {len(column_names)} from [column names].")
+                    yield dict(zip(column_names, values))
+
+    @classmethod
+    def parse_many(cls, filepaths: List[str], max_workers: Optional[int] = None) -> List['VboFile']:
+        """
+        Parse several .vbo files in parallel, one file per worker process.
+
+        Parameters:
+            filepaths (List[str]): Paths to the .vbo files to parse.
+            max_workers (Optional[int]): Number of worker processes (defaults to the number of CPUs).
+
+        Returns:
+            List[VboFile]: Parsed files, in the same order as filepaths.
+
+        Notes:
+            - Parsing is pure Python, so processes are used rather than threads to run files concurrently.
+            - Parsed objects are sent back to the caller by pickling, so the gain is largest on many files.
+            - On platforms that start workers with spawn (Windows, macOS), the calling script must run
+              parse_many() under an `if __name__ == '__main__':` guard, as each worker re-imports the main module.
+        """
+        max_workers = max_workers or os.cpu_count() or 1
+        if len(filepaths) < 2 or max_workers == 1:
+            return [cls(filepath) for filepath in filepaths]
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(cls, filepaths, chunksize=max(1, len(filepaths) // (4 * max_workers))))
 
     def write(self, filepath: str) -> None:
         """
@@ -72,41 +184,42 @@ class VboFile:
 
         Parameters:
             filepath (str): Destination file path where the .vbo content will be written.
+
+        Raises:
+            ValueError: If the [data] columns do not all have the same number of rows.
         """
+        chunks: List[str] = []
+        append = chunks.append
+        extend = chunks.extend
+        for section, lines in self.sections.items():
+            if section == 'file_header':
+                extend(line + '\n' for line in lines)
+                append('\n')
+                continue
+            
+            # The [section] header
+            append(section + '\n')
+
+            if section == '[column names]' and lines is not None:
+                append(' '.join(lines) + '\n')
+                # Add exactly one blank line after [column names]
+                append('\n')
+            elif section == '[data]' and self.sections['[column names]'] is not None:
+                extend(' '.join(row) + '\n' for row in zip(*lines.values(), strict=True))
+            elif section == '[header]' and lines is not None:
+                extend(line + '\n' for line in lines)
+                append('\n')
+            else:
+                extend(line + '\n' for line in lines)
+                append('\n')
+
+        # Single write of the whole content
         with open(filepath, 'w', encoding='utf-8') as f:
-            for section, lines in self.sections.items():
-                if section == 'file_header':
-                    for line in lines:
-                        f.write(line + '\n')
-                    f.write('\n')
-                    continue
-                
-                # The [section] header
-                f.write(section + '\n')
-
-                if section == '[column names]' and self.sections[section] is not None:
-                    f.write(' '.join(self.sections[section]) + '\n')
-                    # Add exactly one blank line after [column names]
-                    f.write('\n')
-                elif section == '[data]' and self.sections['[column names]'] is not None:
-                    for i in range(self.nval):
-                        line = []
-                        if self.sections[section]:
-                            for col in self.sections[section]:
-                                line.append(self.sections[section][col][i])
-                            f.write(' '.join(line) + '\n')
-                elif section == '[header]' and self.sections[section] is not None:
-                    for line in self.sections[section]:
-                        f.write(line + '\n')
-                    f.write('\n')
-                else:
-                    for line in lines:
-                        f.write(line + '\n')
-                    f.write('\n')
+            f.write(''.join(chunks))
 
     def __move_section(self, section_to_move: str, after_section: str) -> None:
         """
-        Move a section in the internal OrderedDict to a new position.
+        Move a section in the internal sections dict to a new position, in place.
 
         Parameters:
             section_to_move (str): Section key to move (including brackets), e.g. '[avi]'.
@@ -120,20 +233,13 @@ class VboFile:
             logging.warning(f"Cannot move section {section_to_move} after {after_section}: one of the sections is missing.")
             return
 
-        items = list(self.sections.items())
-        # Remove the section to move
-        section_item = None
-        for i, (k, v) in enumerate(items):
-            if k == section_to_move:
-                section_item = items.pop(i)
-                break
-        # Find the index after which to insert
-        for i, (k, v) in enumerate(items):
-            if k == after_section:
-                items.insert(i + 1, section_item)
-                break
-        # Rebuild OrderedDict
-        self.sections = OrderedDict(items)
+        keys = list(self.sections)
+        # Sections that must end up after section_to_move
+        tail = [k for k in keys[keys.index(after_section) + 1:] if k != section_to_move]
+        # Reorder in place: re-inserting a key moves it to the end of the dict
+        self.sections[section_to_move] = self.sections.pop(section_to_move)
+        for k in tail:
+            self.sections[k] = self.sections.pop(k)
 
     def add_avi_section(self, video_file_name: str, format: str, number: int, start_sync_time: int, time_column: str = 'time') -> None:
         """
@@ -197,12 +303,36 @@ class VboFile:
             constant_value (str): String value to use for every row in the new column.
         """
 
-        def constant_function(data: OrderedDict[str, List[str]]) -> OrderedDict[str, List[str]]:
-            data[data_column_name] = [constant_value] * self.nval
-            return data
-
         if data_column_name not in self.sections['[data]']:
-            self.add_computed_column(header_column_name, constant_function)
+            self.__install_column(header_column_name, data_column_name, [constant_value] * self.nval)
+
+    def __install_column(self, header_column_name: str, data_column_name: str, values: List[str]) -> None:
+        """
+        Register a new column in the header, [column names] and [data] sections.
+
+        Parameters:
+            header_column_name (str): Header entry to add to the '[header]' section.
+            data_column_name (str): New column key for the '[data]' mapping and '[column names]'.
+            values (List[str]): Textual values, one per row.
+
+        Raises:
+            ValueError: If the header column already exists.
+            ValueError: If values does not hold exactly one entry per row.
+        """
+        if header_column_name in self.sections['[header]']:
+            raise ValueError(f"Header column {header_column_name} already exists in headers.")
+        data = self.sections['[data]']
+        if len(values) != self.nval:
+            # Do not leave a short/long column behind: write() would refuse the whole [data] section
+            if data.get(data_column_name) is values:
+                del data[data_column_name]
+            raise ValueError(f"Column {data_column_name} has {len(values)} values, expected {self.nval}.")
+        self.sections['[header]'].append(header_column_name)
+
+        # Columns added by a compute function are already in place
+        if data.get(data_column_name) is not values:
+            data[data_column_name] = values
+        self.sections['[column names]'].append(data_column_name)
 
     def add_computed_column(
         self,
@@ -220,6 +350,7 @@ class VboFile:
         Raises:
             ValueError: If the computed column does not add exactly one new column.
             ValueError: If the header column already exists.
+            ValueError: If the new column does not have one value per row.
 
         Help on compute_function:
             The compute_function should have the signature:
@@ -232,19 +363,80 @@ class VboFile:
                 Values: lists of strings. Each string is the textual representation as it will be written to the .vbo file (keep leading zeros, signs, width, decimals, etc.).
         """
         
-        if header_column_name not in self.sections['[header]']:
-            self.sections['[header]'].append(header_column_name)
-        else:
+        if header_column_name in self.sections['[header]']:
             raise ValueError(f"Header column {header_column_name} already exists in headers.")
 
-        self.sections['[data]'] = compute_function(self.sections['[data]'])
+        data = self.sections['[data]'] = compute_function(self.sections['[data]'])
 
-        # Find out which column has been added
-        new_columns = [col for col in self.sections['[data]'] if col not in self.sections['[column names]']]
+        # Find out which column has been added, with one set lookup per column
+        known = set(self.sections['[column names]'])
+        new_columns = [col for col in data if col not in known]
         if len(new_columns) != 1:
             raise ValueError("Computed column must add exactly one new column.")
-        else:
-            self.sections['[column names]'].append(new_columns[0])
+        self.__install_column(header_column_name, new_columns[0], data[new_columns[0]])
+
+    def add_computed_columns(
+        self,
+        compute_functions: OrderedDict[str, Callable[[OrderedDict[str, List[str]]], OrderedDict[str, List[str]]]],
+        max_workers: Optional[int] = None
+    ) -> None:
+        """
+        Add several independent computed columns, running their compute functions in a thread pool.
+
+        Parameters:
+            compute_functions (OrderedDict[str, Callable]): Header column name -> compute function, with the
+                same contract as in add_computed_column(). Columns are added in this order.
+            max_workers (Optional[int]): Maximum number of worker threads (default os.cpu_count()).
+
+        Raises:
+            ValueError: If a header column already exists.
+            ValueError: If a compute function does not add exactly one new column.
+            ValueError: If two compute functions add the same column.
+            ValueError: If a new column does not have one value per row.
+
+        Notes:
+            - No column is added unless every compute function succeeds and passes the checks above.
+            - Each compute function receives its own shallow copy of the current data, so it cannot see
+              the columns computed by the others. Use add_computed_column() for dependent columns.
+            - Columns a compute function replaces or removes are applied as in add_computed_column().
+            - Only the NumPy array operations release the GIL. Parsing and formatting the string columns
+              hold it, and that is most of the work of the bundled compute functions, so the speed-up is limited.
+            - Input columns parsed by one compute function are cached on the shared data and reused by the others.
+        """
+
+        # The [header] list is the source of truth; take one snapshot of it for the whole batch
+        header = set(self.sections['[header]'])
+        for header_column_name in compute_functions:
+            if header_column_name in header:
+                raise ValueError(f"Header column {header_column_name} already exists in headers.")
+
+        data = self.sections['[data]']
+        with ThreadPoolExecutor(max_workers=max_workers or os.cpu_count()) as executor:
+            futures = [executor.submit(compute_function, data.copy()) for compute_function in compute_functions.values()]
+            results = [future.result() for future in futures]
+        # Columns every compute function started from, as merging updates data in place
+        base = dict(data)
+
+        # Check every result before installing any, so a failing one does not leave the batch half-applied
+        new_columns: List[str] = []
+        for result in results:
+            added = [col for col in result if col not in base]
+            if len(added) != 1:
+                raise ValueError("Computed column must add exactly one new column.")
+            if added[0] in new_columns:
+                raise ValueError(f"Column {added[0]} is added by more than one compute function.")
+            if len(result[added[0]]) != self.nval:
+                raise ValueError(f"Column {added[0]} has {len(result[added[0]])} values, expected {self.nval}.")
+            new_columns.append(added[0])
+
+        for header_column_name, new_column, result in zip(compute_functions, new_columns, results):
+            # Replay the changes of this result against the shared input, as add_computed_column() would keep them
+            for col in [col for col in base if col not in result]:
+                data.pop(col, None)
+            for col, values in result.items():
+                if base.get(col) is not values:
+                    data[col] = values
+            self.__install_column(header_column_name, new_column, data[new_column])
 
     def add_gps_heading_column(self, heading_column: str = 'heading_gps', long_column: str = 'long', lat_column: str = 'lat', smoothing_window: int = 5) -> None:
         """